@@ -442,15 +442,10 @@ class AndorCamera(object):
         iWidth = int((hend - hstart + 1) / float(hbin))
         iHeight = int((vend - vstart + 1) / float(vbin))
 
-        dim = int(num_images * iWidth * iHeight)
-        image_struct = c.c_int * dim
-        data = image_struct()
-        error = dll.GetAcquiredData(c.pointer(data), dim)
+        image = np.empty((num_images, iHeight, iWidth), dtype=np.intc)
+        error = dll.GetAcquiredData(image.ctypes.data_as(c.POINTER(c.c_int)), image.size)
 
         if ERROR_CODE[error] == 'DRV_SUCCESS':
-            data = data[:]
-
-            image = np.reshape(data, (num_images, iHeight, iWidth))
             return image
         elif ERROR_CODE[error] == 'DRV_NO_NEW_DATA':
             return np.array([])
@@ -463,13 +458,9 @@ class AndorCamera(object):
         iWidth = int((hend - hstart + 1) / float(hbin))
         iHeight = int((vend - vstart + 1) / float(vbin))
 
-        dim = int(iWidth * iHeight)
-        image_struct = c.c_int * dim
-        data = image_struct()
-        error = dll.GetMostRecentImage(c.pointer(data), dim)
+        image = np.empty((iHeight, iWidth), dtype=np.intc)
+        error = dll.GetMostRecentImage(image.ctypes.data_as(c.POINTER(c.c_int)), image.size)
         if (ERROR_CODE[error] == 'DRV_SUCCESS'):
-            data = data[:]
-            image = np.reshape(data, (iHeight, iWidth))
             return image
         elif ERROR_CODE[error] == 'DRV_NO_NEW_DATA':
             return np.array([])
@@ -62,35 +62,22 @@ class AbsorptionAnalyzer(QObject):
     def atom_count_analysis_below_sat(self, optical_density,
                                       detuning=0):
         detuning_factor = 1 + (2 * detuning / self.linewidth) ** 2
-        column_density_below_sat = (detuning_factor / self.cross_section) * optical_density
         column_area = self.pixel_area / self.magnification**2  # size of a pixel in object plane
-        column_number = column_area * column_density_below_sat
+        od_to_number = column_area * detuning_factor / self.cross_section
+        column_number = od_to_number * optical_density
         return column_number
 
     def atom_count_analysis_above_sat(self, atom_counts, bright_counts, image_pulse_time=40e-6,
                                       efficiency_path=1.0):
-        # convert counts to detected photons
-        atom_photons_det = atom_counts / self.count_conversion
-        bright_photons_det = bright_counts / self.count_conversion
+        # Every step from counts to atom number is linear, so the conversions are folded into one scalar and the
+        # images are only touched once.
+        # counts -> detected photons -> detected intensity -> intensity at the atoms -> saturation parameter s0
+        counts_to_s0 = (hbar * self.transition_frequency
+                        / (self.count_conversion * self.pixel_area * image_pulse_time * efficiency_path
+                           * self.magnification**2 * self.saturation_intensity))
 
-        # convert detected photons to detected intensity
-        atom_intensity_det = (atom_photons_det *
-                              (hbar * self.transition_frequency) / (self.pixel_area * image_pulse_time))
-        bright_intensity_det = (bright_photons_det *
-                                (hbar * self.transition_frequency) / (self.pixel_area * image_pulse_time))
-
-        # convert detected intensity to intensity before and after atoms
-        intensity_out = atom_intensity_det / efficiency_path / self.magnification**2
-        intensity_in = bright_intensity_det / efficiency_path / self.magnification**2
-
-        # convert intensity in and out to resonant saturation parameter in and out
-        s0_out = intensity_out / self.saturation_intensity
-        s0_in = intensity_in / self.saturation_intensity
-
-        # calculate column density from s0_in and s0_out
-        column_density = (s0_in - s0_out) / self.cross_section
-
-        # calculate column atom number from column_density and column_area
+        # calculate column atom number from column density (s0_in - s0_out) / cross_section and column_area
         column_area = self.pixel_area / self.magnification**2  # size of a pixel in the object plane
-        column_number = column_density * column_area
+        counts_to_number = counts_to_s0 * column_area / self.cross_section
+        column_number = (bright_counts - atom_counts) * counts_to_number
         return column_number
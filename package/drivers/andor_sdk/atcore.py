@@ -1,3 +1,4 @@
+import os
 import sys
 if sys.version < '3':
     import codecs
@@ -51,6 +52,7 @@ class ATCore(object):
         36: 'AT_ERR_NULL_PTRSIZE',
         37: 'AT_ERR_NOMEMORY',
         38: 'AT_AT_ERR_DEVICEINUSE',
+        39: 'AT_ERR_DEVICENOTFOUND',
         100: 'AT_ERR_HARDWARE_OVERFLOW',
     }
     __version__ = '0.1'
@@ -109,6 +111,10 @@ class ATCore(object):
     AT_HANDLE_UNINITIALISED= -1
     AT_HNDL_SYSTEM = 1
 
+    # Number of live ATCore instances that have initialised the library. AT_FinaliseLibrary tears the SDK down for
+    # the whole process, so only the last instance to go away calls it.
+    _instance_count = 0
+
     def __init__(self):
         from cffi import FFI
         self.ffi = FFI()
@@ -175,17 +181,65 @@ class ATCore(object):
         """)
 
         #self.lib = self.ffi.verify('#include "atcore.h"', include_dirs=["."], libraries=["atcore"])
-        self.lib = self.ffi.dlopen('atcore')
+        # Load atcore from next to this module by absolute path where it is shipped, falling back to the system
+        # library search only when it is not.
+        library_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), self.LIBRARY_NAME + '.dll')
+        if not os.path.exists(library_path):
+            library_path = self.LIBRARY_NAME
+        self.lib = self.ffi.dlopen(library_path)
         self.handle_return(self.lib.AT_InitialiseLibrary())
+        self._initialised = True
+        ATCore._instance_count += 1
+
+        # Output parameters are allocated once and reused by the getters. ATCore is therefore not safe to query from
+        # several threads at once.
+        self._bool_result = self.ffi.new("AT_BOOL *")
+        self._int_result = self.ffi.new("AT_64 *")
+        self._float_result = self.ffi.new("double *")
+        self._index_result = self.ffi.new("int *")
+        self._wait_buffer_ptr = self.ffi.new("AT_U8 **")
+        self._wait_buffer_size = self.ffi.new("int *")
+        self._string_buffers = {}
+        self._features = {}
 
     def __del__(self):
-        self.handle_return(self.lib.AT_FinaliseLibrary())
+        if not getattr(self, '_initialised', False):
+            return
+        self._initialised = False
+        ATCore._instance_count -= 1
+        if ATCore._instance_count == 0:
+            self.handle_return(self.lib.AT_FinaliseLibrary())
 
     def handle_return(self,ret_value):
-        if ret_value != 0:
-            raise ATCoreException('{} ({})'.format(ret_value, self._ERRORS[ret_value]))
+        # AT_SUCCESS is 0, so the success path is a single truth test
+        if ret_value:
+            raise ATCoreException('{} ({})'.format(ret_value, self._ERRORS.get(ret_value, 'AT_ERR_UNKNOWN')))
         return ret_value
 
+    def _feature(self, command):
+        """Return the AT_WC string for feature name command, converting it only on first use.
+        """
+        feature = self._features.get(command)
+        if feature is None:
+            feature = self.ffi.new("AT_WC []", u(command))
+            self._features[command] = feature
+        return feature
+
+    def _get_value(self, function, result, AT_H, command):
+        """Call an AT_Get*/AT_Is* style function for feature command and return its output parameter.
+        """
+        self.handle_return(function(AT_H, self._feature(command), result))
+        return result[0]
+
+    def _string_buffer(self, result_length):
+        """Return a reusable AT_WC buffer holding result_length characters.
+        """
+        result = self._string_buffers.get(result_length)
+        if result is None:
+            result = self.ffi.new("AT_WC [%s]" % result_length)
+            self._string_buffers[result_length] = result
+        return result
+
     def get_version(self):
         return self.__version__
 
@@ -205,111 +259,87 @@ class ATCore(object):
     def is_implemented(self, AT_H, command):
         """Checks if command is implemented.
         """
-        result = self.ffi.new("AT_BOOL *")
-        self.handle_return(self.lib.AT_IsImplemented(AT_H, u(command), result))
-        return result[0]
+        return self._get_value(self.lib.AT_IsImplemented, self._bool_result, AT_H, command)
 
     def is_readable(self, AT_H, command):
         """Checks if command is readable.
         """
-        result = self.ffi.new("AT_BOOL *")
-        self.handle_return(self.lib.AT_IsReadable(AT_H, u(command), result))
-        return result[0]
+        return self._get_value(self.lib.AT_IsReadable, self._bool_result, AT_H, command)
 
     def is_writable(self, AT_H, command):
         """Checks if command is writable.
         """
-        result = self.ffi.new("AT_BOOL *")
-        self.handle_return(self.lib.AT_IsWritable(AT_H, u(command), result))
-        return result[0]
+        return self._get_value(self.lib.AT_IsWritable, self._bool_result, AT_H, command)
 
     def is_readonly(self, AT_H, command):
         """Checks if command is read only.
         """
-        result = self.ffi.new("AT_BOOL *")
-        self.handle_return(self.lib.AT_IsReadOnly(AT_H, u(command), result))
-        return result[0]
+        return self._get_value(self.lib.AT_IsReadOnly, self._bool_result, AT_H, command)
 
     def set_int(self, AT_H, command, value):
         """SetInt function.
         """
-        self.handle_return(self.lib.AT_SetInt(AT_H, u(command), value))
+        self.handle_return(self.lib.AT_SetInt(AT_H, self._feature(command), value))
 
     def get_int(self, AT_H, command):
         """Run command and get Int return value.
         """
-        result = self.ffi.new("AT_64 *")
-        self.handle_return(self.lib.AT_GetInt(AT_H, u(command), result))
-        return result[0]
+        return self._get_value(self.lib.AT_GetInt, self._int_result, AT_H, command)
 
     def get_int_max(self, AT_H, command):
         """Run command and get maximum Int return value.
         """
-        result = self.ffi.new("AT_64 *")
-        self.handle_return(self.lib.AT_GetIntMax(AT_H, u(command), result))
-        return result[0]
+        return self._get_value(self.lib.AT_GetIntMax, self._int_result, AT_H, command)
 
     def get_int_min(self, AT_H, command):
         """Run command and get minimum Int return value.
         """
-        result = self.ffi.new("AT_64 *")
-        self.handle_return(self.lib.AT_GetIntMin(AT_H, u(command), result))
-        return result[0]
+        return self._get_value(self.lib.AT_GetIntMin, self._int_result, AT_H, command)
 
     def set_float(self, AT_H, command, value):
         """Set command with Float value parameter.
         """
-        self.handle_return(self.lib.AT_SetFloat(AT_H, u(command), value))
+        self.handle_return(self.lib.AT_SetFloat(AT_H, self._feature(command), value))
 
     def get_float(self, AT_H, command):
         """Run command and get float return value.
         """
-        result = self.ffi.new("double *")
-        self.handle_return(self.lib.AT_GetFloat(AT_H, u(command), result))
-        return result[0]
+        return self._get_value(self.lib.AT_GetFloat, self._float_result, AT_H, command)
 
     def get_float_max(self, AT_H, command):
         """Run command and get maximum float return value.
         """
-        result = self.ffi.new("double *")
-        self.handle_return(self.lib.AT_GetFloatMax(AT_H, u(command), result))
-        return result[0]
+        return self._get_value(self.lib.AT_GetFloatMax, self._float_result, AT_H, command)
 
     def get_float_min(self, AT_H, command):
         """Run command and get minimum float return value.
         """
-        result = self.ffi.new("double *")
-        self.handle_return(self.lib.AT_GetFloatMin(AT_H, u(command), result))
-        return result[0]
+        return self._get_value(self.lib.AT_GetFloatMin, self._float_result, AT_H, command)
 
     def get_bool(self, AT_H, command):
         """Run command and get Bool return value.
         """
-        result = self.ffi.new("AT_BOOL *")
-        self.handle_return(self.lib.AT_GetBool(AT_H, u(command), result))
-        return result[0]
+        return self._get_value(self.lib.AT_GetBool, self._bool_result, AT_H, command)
 
     def set_bool(self, AT_H, command, value):
         """Set command with Bool value parameter.
         """
-        self.handle_return(self.lib.AT_SetBool(AT_H, u(command), value))
+        self.handle_return(self.lib.AT_SetBool(AT_H, self._feature(command), value))
 
     def set_enum_index(self, AT_H, command, value):
         """Set command with Enumerated value parameter.
         """
-        self.handle_return(self.lib.AT_SetEnumIndex(AT_H, u(command), value))
+        self.handle_return(self.lib.AT_SetEnumIndex(AT_H, self._feature(command), value))
 
     def set_enum_string(self, AT_H, command, item):
         """Set command with EnumeratedString value parameter.
         """
-        self.handle_return(self.lib.AT_SetEnumString(AT_H, u(command), u(item)))
+        self.handle_return(self.lib.AT_SetEnumString(AT_H, self._feature(command), u(item)))
 
     def get_enum_index(self, AT_H, command):
         """Run command and set Enumerated return value.
         """
-        result = self.ffi.new("int *")
-        self.handle_return(self.lib.AT_GetEnumIndex(AT_H, u(command), result))
-        return result[0]
+        return self._get_value(self.lib.AT_GetEnumIndex, self._index_result, AT_H, command)
 
     def get_enum_string_options(self, AT_H, command) :
         """Get list of option strings
@@ -317,66 +347,62 @@ class ATCore(object):
         count = self.get_enum_count(AT_H, command)
         strings = []
         for i in range(0, count):
-            strings.append(self.get_enum_string_by_index(AT_H, u(command),i))
+            strings.append(self.get_enum_string_by_index(AT_H, command,i))
         return strings
 
     def get_enum_string(self, AT_H, command, result_length=128):
         """Run command and set Enumerated return value.
         """
         ret = self.get_enum_index(AT_H, command)
-        return self.get_enum_string_by_index(AT_H, u(command), ret)
+        return self.get_enum_string_by_index(AT_H, command, ret)
 
     def get_enum_count(self, AT_H, command):
         """Run command and set Enumerated return value.
         """
-        result = self.ffi.new("int *")
-        self.handle_return(self.lib.AT_GetEnumCount(AT_H, u(command), result))
-        return result[0]
+        return self._get_value(self.lib.AT_GetEnumCount, self._index_result, AT_H, command)
 
     def is_enum_index_available(self, AT_H, command, index):
         """Check if enumerated index is available
         """
-        result = self.ffi.new("AT_BOOL *")
-        self.handle_return(self.lib.AT_IsEnumIndexAvailable(AT_H, u(command), index, result))
+        result = self._bool_result
+        self.handle_return(self.lib.AT_IsEnumIndexAvailable(AT_H, self._feature(command), index, result))
         return result[0]
 
     def is_enum_index_implemented(self, AT_H, command, index):
         """Check if enumerated index is implemented
         """
-        result = self.ffi.new("AT_BOOL *")
-        self.handle_return(self.lib.AT_IsEnumIndexImplemented(AT_H, u(command), index, result))
+        result = self._bool_result
+        self.handle_return(self.lib.AT_IsEnumIndexImplemented(AT_H, self._feature(command), index, result))
         return result[0]
 
     def get_enum_string_by_index(self, AT_H, command, index, result_length=128):
         """Get command with EnumeratedString value parameter.
         """
-        result = self.ffi.new("AT_WC [%s]" % result_length)
-        self.handle_return(self.lib.AT_GetEnumStringByIndex(AT_H, u(command), index, result, result_length))
+        result = self._string_buffer(result_length)
+        self.handle_return(self.lib.AT_GetEnumStringByIndex(AT_H, self._feature(command), index, result, result_length))
         return self.ffi.string(result)
 
     def command(self, AT_H, command):
         """Run command.
         """
-        self.handle_return(self.lib.AT_Command(AT_H, u(command)))
+        self.handle_return(self.lib.AT_Command(AT_H, self._feature(command)))
 
     def set_string(self, AT_H, command, strvalue):
         """SetString function.
         """
-        self.handle_return(self.lib.AT_SetString(AT_H, u(command), u(strvalue)))
+        self.handle_return(self.lib.AT_SetString(AT_H, self._feature(command), u(strvalue)))
 
     def get_string(self, AT_H, command, result_length=128):
         """Run command and get string return value.
         """
-        result = self.ffi.new("AT_WC [%s]" % result_length)
-        self.handle_return(self.lib.AT_GetString(AT_H, u(command), result, result_length))
+        result = self._string_buffer(result_length)
+        self.handle_return(self.lib.AT_GetString(AT_H, self._feature(command), result, result_length))
         return self.ffi.string(result, result_length)
 
     def get_string_max_length(self, AT_H, command):
         """Run command and get maximum Int return value.
         """
-        result = self.ffi.new("int *")
-        self.handle_return(self.lib.AT_GetStringMaxLength(AT_H, u(command), result))
-        return result[0]
+        return self._get_value(self.lib.AT_GetStringMaxLength, self._index_result, AT_H, command)
 
     def queue_buffer(self, AT_H, buf_ptr, buffer_size):
         """Put buffer in queue.
@@ -384,10 +410,10 @@ class ATCore(object):
         self.handle_return(self.lib.AT_QueueBuffer(AT_H, self.ffi.cast("AT_U8 *", buf_ptr), buffer_size))
 
     def wait_buffer(self, AT_H, timeout=20000):
-        """Wait for next buffer to fill.
+        """Wait for next buffer to fill. The returned pointer cell is reused and overwritten by the next call.
         """
-        buf_ptr = self.ffi.new("AT_U8 **")
-        buffer_size = self.ffi.new("int *")
+        buf_ptr = self._wait_buffer_ptr
+        buffer_size = self._wait_buffer_size
         self.handle_return(self.lib.AT_WaitBuffer(AT_H, buf_ptr, buffer_size, int(timeout)))
         return (buf_ptr, buffer_size[0])
 
@@ -5,8 +5,31 @@ from package.drivers.jkamgendriver import JKamGenDriver
 
 os.environ['PATH'] = os.path.dirname(__file__) + os.sep + 'andor_sdk' + ';' + os.environ['PATH']
 
+BUFFER_ALIGNMENT = 4096  # bytes, one page. SDK3 requires at least 8
+
+
+class AndorImageConfig:
+    """
+    Image geometry read back from the camera when settings are loaded. It is read once per arm to build frame_view.
+    """
+    __slots__ = ('aoiheight', 'aoiwidth', 'aoistride', 'pixelencoding')
+
+    def __init__(self, aoiheight, aoiwidth, aoistride, pixelencoding):
+        self.aoiheight = aoiheight
+        self.aoiwidth = aoiwidth
+        self.aoistride = aoistride
+        self.pixelencoding = pixelencoding
+
 
 class AndorDriver(JKamGenDriver):
+    def __init__(self):
+        super(AndorDriver, self).__init__()
+        self.imageSizeBytes = 0
+        self.buf = None
+        self.buf_address = None
+        self.frame_view = None
+        self.config = None
+
     def _open_connection(self):
         self.sdk3 = ATCore()
         print('Connected to Andor driver')
@@ -64,18 +87,14 @@ class AndorDriver(JKamGenDriver):
         self.sdk3.command(cam, 'SoftwareTrigger')
 
     def _grab_frame(self, cam):
-        self.sdk3.queue_buffer(cam, self.buf.ctypes.data, self.imageSizeBytes)
+        self.sdk3.queue_buffer(cam, self.buf_address, self.imageSizeBytes)
         if not self._trigger_enabled:
             self._execute_software_trigger(cam)
         try:
             _, _ = self.sdk3.wait_buffer(cam, timeout=ATCore.AT_INFINITE)
         except ATCoreException:
             return
-        np_arr = self.buf[0:self.config['aoiheight'] * self.config['aoistride']]
-        np_d = np_arr.view(dtype='H')
-        np_d = np_d.reshape(self.config['aoiheight'], round(np_d.size / self.config['aoiheight']))
-        formatted_img = np_d[0:self.config['aoiheight'], 0:self.config['aoiwidth']]
-        frame = np.copy(formatted_img.astype(int))
+        frame = self.frame_view.astype(int)
         return frame
 
     def _load_default_settings(self, cam):
@@ -253,9 +272,29 @@ class AndorDriver(JKamGenDriver):
 
         self.imageSizeBytes = self.sdk3.get_int(cam, "ImageSizeBytes")
         print("    Queuing Buffer (size", self.imageSizeBytes, ")")
-        self.buf = np.empty((self.imageSizeBytes,), dtype='B')
+        # Re-arming with an unchanged AOI reuses the existing buffer rather than allocating a fresh one
+        if self.buf is None or self.buf.size != self.imageSizeBytes:
+            self.buf = aligned_empty(self.imageSizeBytes, BUFFER_ALIGNMENT)
+
+        self.config = AndorImageConfig(aoiheight=self.sdk3.get_int(cam, "AOIHeight"),
+                                       aoiwidth=self.sdk3.get_int(cam, "AOIWidth"),
+                                       aoistride=self.sdk3.get_int(cam, "AOIStride"),
+                                       pixelencoding=self.sdk3.get_enum_string(cam, "PixelEncoding"))
+
+        # The camera always fills the single queued buffer, so the pixel view into it only changes with the AOI
+        self.buf_address = self.buf.ctypes.data
+        aoiheight = self.config.aoiheight
+        aoiwidth = self.config.aoiwidth
+        np_arr = self.buf[0:aoiheight * self.config.aoistride]
+        np_d = np_arr.view(dtype='H')
+        np_d = np_d.reshape(aoiheight, round(np_d.size / aoiheight))
+        self.frame_view = np_d[0:aoiheight, 0:aoiwidth]
+
 
-        self.config = {'aoiheight': self.sdk3.get_int(cam, "AOIHeight"),
-                       'aoiwidth': self.sdk3.get_int(cam, "AOIWidth"),
-                       'aoistride': self.sdk3.get_int(cam, "AOIStride"),
-                       'pixelencoding': self.sdk3.get_enum_string(cam, "PixelEncoding")}
+def aligned_empty(size, alignment):
+    """
+    Return an uninitialized uint8 array of size bytes whose data pointer is a multiple of alignment bytes.
+    """
+    raw = np.empty((size + alignment,), dtype='B')
+    offset = -raw.ctypes.data % alignment
+    return raw[offset:offset + size]
@@ -9,9 +9,10 @@ class FrameGrabber(QThread):
         self.max_fps = max_fps
 
     def run(self):
+        frame_interval_ms = int(1 / self.max_fps * 1e3)
         while self.driver.acquiring:
             self.driver.grab_frame()
-            self.wait(int(1 / self.max_fps * 1e3)) # Slow down frame rate to self.max_fps to give GUI time to update
+            self.wait(frame_interval_ms) # Slow down frame rate to self.max_fps to give GUI time to update
 
 
 class JKamGenDriver(QObject):
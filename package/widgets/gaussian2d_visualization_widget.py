@@ -17,6 +17,8 @@ class GaussianIntegrateAxisPlot(pg.PlotItem):
     def __init__(self, *args, **kwargs):
         super(GaussianIntegrateAxisPlot, self).__init__(*args, **kwargs)
         self.setMouseEnabled(x=False, y=False)
+        self.data_curve = self.plot(pen=pg.mkPen(width=0.5), symbolBrush='w', symbolSize=5)
+        self.model_curve = self.plot()
 
     def update(self, data_img, model_img, slice_axis, sx, sy, offset=0):
         """
@@ -26,24 +28,23 @@ class GaussianIntegrateAxisPlot(pg.PlotItem):
         for vertical slice integrate along horizontal axis and plot the data vertically to put slice plot to the side
         of image in display.
         """
-        self.clear()
         if slice_axis == SliceAxisType.VERTICAL:
             y_range = data_img.shape[0]
             integrate_axis = 1
             data_cut_data = np.nansum(data_img, axis=integrate_axis) / np.sqrt(2 * np.pi * sx ** 2)
             model_cut_data = np.nansum(model_img, axis=integrate_axis) / np.sqrt(2 * np.pi * sx ** 2)
-            self.plot(data_cut_data, offset + np.arange(y_range),
-                      pen=pg.mkPen(width=0.5), symbolBrush='w', symbolSize=5)
-            self.plot(model_cut_data, offset + np.arange(y_range), pen=pg.mkPen('r'))
+            self.data_curve.setData(data_cut_data, offset + np.arange(y_range))
+            self.model_curve.setData(model_cut_data, offset + np.arange(y_range))
+            self.model_curve.setPen(pg.mkPen('r'))
 
         elif slice_axis == SliceAxisType.HORIZONTAL:
             x_range = data_img.shape[1]
             integrate_axis = 0
             data_cut_data = np.nansum(data_img, axis=integrate_axis) / np.sqrt(2 * np.pi * sy ** 2)
             model_cut_data = np.nansum(model_img, axis=integrate_axis) / np.sqrt(2 * np.pi * sy ** 2)
-            self.plot(offset + np.arange(x_range), data_cut_data,
-                      pen=pg.mkPen(width=0.5), symbolBrush='w', symbolSize=5)
-            self.plot(offset + np.arange(x_range), model_cut_data, pen=pg.mkPen('b'))
+            self.data_curve.setData(offset + np.arange(x_range), data_cut_data)
+            self.model_curve.setData(offset + np.arange(x_range), model_cut_data)
+            self.model_curve.setPen(pg.mkPen('b'))
             self.invertY(True)
 
 
@@ -80,6 +81,8 @@ class FitVisualizationWindow(QWidget):
     def __init__(self, parent=None):
         super(FitVisualizationWindow, self).__init__(parent=parent)
         self.fit_struct = None
+        self.param_labels = dict()
+        self.ngauss_label = None
         self.setupUi()
         self.setup_plots()
 
@@ -113,12 +116,29 @@ class FitVisualizationWindow(QWidget):
         self.vertical_cut_plot.setYLink(self.data_plot.getViewBox())
         self.vertical_cut_plot.getViewBox().invertY()
 
-    def update_text_display(self, x_offset=0, y_offset=0):
+    def setup_text_display(self, param_keys):
+        """
+        Build one label per fit parameter. Labels are only rebuilt when the set of fit parameters changes, e.g. when
+        the angle or slope terms are toggled, otherwise update_text_display just sets their text.
+        """
         clearLayout(self.text_display_verticalLayout)
+        self.param_labels = dict()
 
         self.text_display_verticalLayout.addItem(QSpacerItem(14, 20, QSizePolicy.Minimum, QSizePolicy.Expanding))
-        for key in self.fit_struct['param_keys']:
+        for key in param_keys:
             label = QLabel()
+            self.text_display_verticalLayout.addWidget(label)
+            self.param_labels[key] = label
+        self.ngauss_label = QLabel()
+        self.text_display_verticalLayout.addWidget(self.ngauss_label)
+        self.text_display_verticalLayout.addItem(QSpacerItem(14, 20, QSizePolicy.Minimum, QSizePolicy.Expanding))
+
+    def update_text_display(self, x_offset=0, y_offset=0):
+        param_keys = self.fit_struct['param_keys']
+        if list(self.param_labels) != list(param_keys):
+            self.setup_text_display(param_keys)
+
+        for key in param_keys:
             val = round(self.fit_struct[key]['val'], 3)
             std = round(self.fit_struct[key]['std'], 3)
             if key == 'x0':
@@ -126,12 +146,8 @@ class FitVisualizationWindow(QWidget):
             if key == 'y0':
                 val += y_offset
             val_str = ufloat(val, std)
-            label.setText(f'{str(key)} = {val_str}')
-            self.text_display_verticalLayout.addWidget(label)
-        label = QLabel()
-        label.setText(f'NGauss = {self.fit_struct["NGauss"]:.3e}')
-        self.text_display_verticalLayout.addWidget(label)
-        self.text_display_verticalLayout.addItem(QSpacerItem(14, 20, QSizePolicy.Minimum, QSizePolicy.Expanding))
+            self.param_labels[key].setText(f'{str(key)} = {val_str}')
+        self.ngauss_label.setText(f'NGauss = {self.fit_struct["NGauss"]:.3e}')
 
     def update(self, fit_struct=None, x_offset=0, y_offset=0):
         if fit_struct is not None:
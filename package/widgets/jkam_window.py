@@ -12,7 +12,6 @@ There are plans to implement a Gaussian fit analyzer.
 Original program by Jonathan Kohler.
 Updated by Justin Gerber (2020) - gerberja@berkeley.edu
 """
-import copy
 import sys
 import ctypes
 from PyQt5.QtCore import pyqtSignal
@@ -41,6 +40,11 @@ class JKamWindow(QMainWindow, Ui_CameraWindow):
         super(JKamWindow, self).__init__()
         self.setupUi(self)
 
+        self.display_frame_dict = {ImagingMode.VIDEO: self.display_video_frame,
+                                   ImagingMode.ABSORPTION: self.display_absorption_frame,
+                                   ImagingMode.FLUORESCENCE: self.display_fluorescence_frame,
+                                   ImagingMode.MULTISHOT: self.display_multishot_frame}
+
         self.frame_received_signal = self.camera_control_widget.frame_received_signal
         self.frame_received_signal.connect(self.on_capture)
 
@@ -75,16 +79,14 @@ class JKamWindow(QMainWindow, Ui_CameraWindow):
         self.show()
 
     def on_capture(self, frame_dict_in):
-        frame_dict = copy.deepcopy(frame_dict_in)
+        # The driver reuses frame_dict_in for every frame but grabs each frame into a fresh array, so only the
+        # dicts need copying. The frame itself is shared with the driver rather than duplicated.
+        frame_dict = {'frame': frame_dict_in['frame'],
+                      'metadata': dict(frame_dict_in['metadata'])}
         self.frame_received_signal.disconnect(self.on_capture)
-        if self.imaging_mode is ImagingMode.VIDEO:
-            self.display_video_frame(frame_dict)
-        elif self.imaging_mode is ImagingMode.ABSORPTION:
-            self.display_absorption_frame(frame_dict)
-        elif self.imaging_mode is ImagingMode.FLUORESCENCE:
-            self.display_fluorescence_frame(frame_dict)
-        elif self.imaging_mode is ImagingMode.MULTISHOT:
-            self.display_multishot_frame(frame_dict)
+        display_frame = self.display_frame_dict.get(self.imaging_mode)
+        if display_frame is not None:
+            display_frame(frame_dict)
         self.frame_received_signal.connect(self.on_capture)
 
     def display_video_frame(self, frame_dict):
@@ -18,11 +18,16 @@ class PlotHistoryWindow(QMainWindow, Ui_PlotHistoryWindow):
 
         self.label = label
         self.num_history = num_history
-        self.history = np.zeros(self.num_history)
+        # Each sample is written twice, num_history apart, so the most recent num_history samples are always a
+        # contiguous slice of the buffer and appending never has to shift the data.
+        self._history_buffer = np.zeros(2 * self.num_history)
+        self._history_index = 0
         self.history_min = self.history.min()
         self.history_max = self.history.max()
 
         self.history_PlotWidget.disableAutoRange()
+        self.history_PlotWidget.setDownsampling(auto=True, mode='peak')
+        self.history_PlotWidget.setClipToView(True)
         self.history_plot = self.history_PlotWidget.plot(pen=mkPen(width=0.5) , symbolBrush='w', symbolSize=4)
         # self.history_plot.setPen(width=2)
         self.history_PlotWidget.setXRange(0, self.num_history)
@@ -38,14 +43,19 @@ class PlotHistoryWindow(QMainWindow, Ui_PlotHistoryWindow):
         self.clear_pushButton.clicked.connect(self.clear_history)
         self.set_max_pushButton.clicked.connect(self.set_max)
 
+    @property
+    def history(self):
+        return self._history_buffer[self._history_index:self._history_index + self.num_history]
+
     def append_data(self, data):
-        self.history = np.roll(self.history, -1)
-        self.history[-1] = data
+        self._history_buffer[self._history_index] = data
+        self._history_buffer[self._history_index + self.num_history] = data
+        self._history_index = (self._history_index + 1) % self.num_history
         self.plot()
         self.data_label.setText(f'{data:.3e}')
 
     def clear_history(self):
-        self.history[:] = 0
+        self._history_buffer[:] = 0
         self.plot()
 
     def set_min(self):